@@ -1,8 +1,11 @@
-import math
+import re
 import os
-import json
-from typing import Union, Dict, List
-from datetime import datetime
+import sys
+import time
+import functools
+from collections import OrderedDict, deque
+from itertools import islice
+from typing import Union, Dict, Deque, List, Optional, Callable, Tuple
 from abc import ABC, abstractmethod
 
 class Constant:
@@ -10,21 +13,71 @@ class Constant:
     GRAVITY_FORCE = 9.8  
 
 
+def _finite(obj):
+    """Replace inf and nan with None so every backend writes the same JSON"""
+    if isinstance(obj, float):
+        return obj if obj - obj == 0 else None
+    if isinstance(obj, dict):
+        return {key: _finite(value) for key, value in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_finite(value) for value in obj]
+    return obj
+
+
+@functools.lru_cache(maxsize=None)
+def _json_backend() -> Tuple[Callable, Callable, type]:
+    """Return (dumps_line, loads, decode_error), using orjson when installed"""
+    try:
+        import orjson
+    except ImportError:
+        import json
+
+        def dumps_line(obj) -> str:
+            return json.dumps(_finite(obj), separators=(",", ":"), ensure_ascii=False, allow_nan=False) + "\n"
+
+        return dumps_line, json.loads, json.JSONDecodeError
+
+    def dumps_line(obj) -> str:
+        return orjson.dumps(_finite(obj), option=orjson.OPT_APPEND_NEWLINE).decode()
+
+    def loads(line):
+        try:
+            return orjson.loads(line)
+        except orjson.JSONDecodeError:
+            # lines from the stdlib writer may still contain Infinity or NaN
+            import json
+
+            return json.loads(line)
+
+    return dumps_line, loads, ValueError
+
 
 class CalculationHistory:
     """
     context manager to save a history
     """
-    def __init__(self, filename: str = "physics_history.json"):
+
+    timestamp_format = "%Y-%m-%d %H:%M:%S"
+    seen_limit = 256
+
+    def __init__(self, filename: str = "physics_history.jsonl", max_entries: int = 1000):
         self.filename = filename
-        self.history: List[Dict] = []
+        self.history: Deque[Dict] = deque(maxlen=max_entries)
+        self._fh = None
+        self._queue = None
+        self._writer = None
+        self._write_errors: List[Exception] = []
+        self._needs_newline = False
+        self._line_count = 0
+        self._skipped = 0
+        self._seen: "OrderedDict[int, None]" = OrderedDict()
         self.load_history()
 
     def __enter__(self):
         return self
     
     def __exit__(self, exc_type, exc_value, exc_tb):
-        self.save_history()
+        self.close()
         if exc_type is not None:
             print(f"Error occured: {exc_value}")
         return False
@@ -32,30 +85,153 @@ class CalculationHistory:
     def add_calculation(self, topic: str, inputs: Dict, results: Dict):
         """Add a calculation to history"""
         entry = {
-            "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            "ts": time.time_ns(),
             "topic": topic,
             "inputs": inputs,
             "results": results
         }
         self.history.append(entry)
-
-    def save_history(self):
-        """Save history to JSON file"""
+        self.save_history(entry)
+
+    def remember(self, fingerprint: int) -> bool:
+        """Record a calculation fingerprint, return False if it was seen recently"""
+        if fingerprint in self._seen:
+            self._seen.move_to_end(fingerprint)
+            return False
+        self._seen[fingerprint] = None
+        if len(self._seen) > self.seen_limit:
+            self._seen.popitem(last=False)
+        return True
+
+    def save_history(self, entry: Dict):
+        """Queue one entry for the background writer"""
+        if self._writer is None:
+            import queue
+            import threading
+
+            self._queue = queue.Queue()
+            self._writer = threading.Thread(target=self._drain, args=(self._queue,), daemon=True)
+            self._writer.start()
+        self._queue.put(entry)
+
+    def _drain(self, entries):
+        """Append queued entries to the JSON Lines file until a None sentinel"""
+        dumps_line, _, _ = _json_backend()
+
+        while True:
+            entry = entries.get()
+            if entry is None:
+                return
+            try:
+                if self._fh is None:
+                    self._fh = open(self.filename, 'a', encoding="utf-8")
+                    if self._needs_newline:
+                        # terminate a torn last line before appending
+                        self._fh.write("\n")
+                        self._needs_newline = False
+                self._fh.write(dumps_line(entry))
+                self._fh.flush()
+                self._line_count += 1
+            except Exception as error:
+                # reported by close(), printing here would interrupt input()
+                self._write_errors.append(error)
+
+    def close(self):
+        """Wait for pending writes, then close the history file"""
+        if self._writer is not None:
+            self._queue.put(None)
+            self._writer.join()
+            self._writer = None
+            self._queue = None
+        for error in self._write_errors:
+            print(f"Warning: Could not save history: {error}")
+        self._write_errors.clear()
+        if self._fh is not None:
+            try:
+                self._fh.close()
+            except IOError as error:
+                print(f"Warning: Could not save history: {error}")
+            self._fh = None
+        maxlen = self.history.maxlen
+        if self._skipped or (maxlen is not None and self._line_count > maxlen):
+            self.compact_history()
+
+    def compact_history(self):
+        """Rewrite the file with only the newest readable lines"""
+        _, loads, decode_error = _json_backend()
+
+        kept = []
         try:
-            with open(self.filename, 'w') as f:
-                json.dump(self.history, f, indent=2)
+            # undecodable bytes from a torn write become U+FFFD and fail to parse
+            with open(self.filename, 'r', encoding="utf-8", errors="replace") as f:
+                for line in deque(f, maxlen=self.history.maxlen):
+                    try:
+                        entry = loads(line)
+                    except decode_error:
+                        continue
+                    if not isinstance(entry, dict):
+                        continue
+                    kept.append(line if line.endswith("\n") else line + "\n")
+            temp = self.filename + ".tmp"
+            with open(temp, 'w', encoding="utf-8") as f:
+                f.writelines(kept)
+            os.replace(temp, self.filename)
         except IOError as error:
-            print(f"Warning: Could not save history: {error}")
+            print(f"Warning: Could not compact history: {error}")
+            return
+        self._line_count = len(kept)
+        self._skipped = 0
+        self._needs_newline = False
 
     def load_history(self):
-        """Load history from JSON file"""
+        """Load history from JSON Lines file"""
+        _, loads, decode_error = _json_backend()
+
+        legacy = os.path.splitext(self.filename)[0] + ".json"
+        if not os.path.exists(self.filename) and os.path.exists(legacy):
+            self.import_legacy(legacy)
+
+        self._skipped = 0
         try:
             if os.path.exists(self.filename):
-                with open(self.filename, 'r') as f:
-                    self.history = json.load(f)
-        except (IOError, json.JSONDecodeError) as error:
+                with open(self.filename, 'r', encoding="utf-8", errors="replace") as f:
+                    # only the newest lines fit in the deque, so skip parsing the rest
+                    tail = deque(enumerate(f, 1), maxlen=self.history.maxlen)
+                if tail:
+                    self._line_count = tail[-1][0]
+                    self._needs_newline = not tail[-1][1].endswith("\n")
+                for _, line in tail:
+                    if not line.strip():
+                        continue
+                    try:
+                        entry = loads(line)
+                    except decode_error:
+                        self._skipped += 1
+                        continue
+                    if not isinstance(entry, dict):
+                        self._skipped += 1
+                        continue
+                    self.history.append(entry)
+        except IOError as error:
             print(f"Warning: Could not load history: {error}")
-            self.history = []
+        if self._skipped:
+            print(f"Warning: Skipped {self._skipped} unreadable history entries")
+
+    def import_legacy(self, legacy: str):
+        """Copy entries from an old JSON array history file into the JSON Lines file"""
+        import json
+
+        dumps_line, _, _ = _json_backend()
+
+        try:
+            with open(legacy, 'r', encoding="utf-8") as f:
+                entries = json.load(f)
+            with open(self.filename, 'w', encoding="utf-8") as f:
+                for entry in entries if isinstance(entries, list) else []:
+                    if isinstance(entry, dict):
+                        f.write(dumps_line(entry))
+        except (IOError, ValueError) as error:
+            print(f"Warning: Could not import old history: {error}")
             
     def display_history(self, limit: int = 10):
         """Display recent calculation history"""
@@ -63,48 +239,94 @@ class CalculationHistory:
             print("No calculation history")
             return
         
-        print(f"CALCULATION HISTORY (Last {min(limit, len(self.history))} entries)")
+        lines = [f"CALCULATION HISTORY (Last {min(limit, len(self.history))} entries)"]
         
-        for entry in self.history[-limit:]:
-            print(f"{entry['timestamp']} - {entry['topic']}")
-            print(f"Inputs: {entry['inputs']}")
-            print(f"Results: {entry['results']}")
+        start = max(0, len(self.history) - limit)
+        for entry in islice(self.history, start, None):
+            lines.append(f"{self.format_timestamp(entry)} - {entry['topic']}")
+            lines.append(f"Inputs: {entry['inputs']}")
+            lines.append(f"Results: {entry['results']}")
+        sys.stdout.write("\n".join(lines) + "\n")
+
+    def format_timestamp(self, entry: Dict) -> str:
+        """Format the entry time, falling back to the old string field"""
+        if "ts" not in entry:
+            return entry.get("timestamp", "")
+        return time.strftime(self.timestamp_format, time.localtime(entry["ts"] // 1_000_000_000))
 
     def clear_history(self):
         """Clear all history"""
-        self.history = []
-        self.save_history()
+        self.close()
+        self.history.clear()
+        self._seen.clear()
+        self._needs_newline = False
+        self._line_count = 0
+        self._skipped = 0
+        try:
+            open(self.filename, 'w', encoding="utf-8").close()
+        except IOError as error:
+            print(f"Warning: Could not clear history: {error}")
         print("History clear successfull!")
 
     
 
 
+_FLOAT_RE = re.compile(r"^[+-]?(\d+\.?\d*|\.\d+)([eE][+-]?\d+)?$")
+_INT_RE = re.compile(r"^[+-]?\d+$")
+
+# display names for result keys
+_LABELS = {
+    "initial_velocity": "Initial Velocity",
+    "final_velocity": "Final Velocity",
+    "acceleration": "Acceleration",
+    "time": "Time",
+    "distance": "Distance",
+    "height": "Height",
+    "speed": "Speed",
+}
+
+
 def get_float_input(prompt: str) -> Union[float, None]:
     """Get float input from user"""
     while True:
-        try:
-            value = input(prompt).strip()
-            if value == "":
-                return None
-            return float(value)
-        except ValueError:
+        value = input(prompt).strip()
+        if value == "":
+            return None
+        if _FLOAT_RE.match(value) is None:
             print("Invalid input! Please enter a number or press Enter to skip.")
+            continue
+        return float(value)
+
+
+def get_floats_batch(prompt: str, n: int) -> List[Optional[float]]:
+    """Get up to n space separated floats from one line, "_" skips a value"""
+    while True:
+        tokens = input(prompt).split()
+        if len(tokens) > n:
+            print(f"Invalid input! Please enter at most {n} values.")
+            continue
+        if not all(token == "_" or _FLOAT_RE.match(token) for token in tokens):
+            print("Invalid input! Please enter numbers or _ to skip.")
+            continue
+        values = [None if token == "_" else float(token) for token in tokens]
+        return values + [None] * (n - len(values))
 
 
 def get_int_input(prompt: str, min_val: int = None, max_val: int = None) -> int:
     """Get integer input with validation"""
     while True:
-        try:
-            value = int(input(prompt).strip())
-            if min_val is not None and value < min_val:
-                print(f"Value must be at least {min_val}")
-                continue
-            if max_val is not None and value > max_val:
-                print(f"Value must be at most {max_val}")
-                continue
-            return value
-        except ValueError:
+        text = input(prompt).strip()
+        if _INT_RE.match(text) is None:
             print("Invalid input! Please enter a valid integer.")
+            continue
+        value = int(text)
+        if min_val is not None and value < min_val:
+            print(f"Value must be at least {min_val}")
+            continue
+        if max_val is not None and value > max_val:
+            print(f"Value must be at most {max_val}")
+            continue
+        return value
 
 
 """
@@ -117,12 +339,21 @@ program function
 
 class PhysicCalcution(ABC):
     """Abstract base class for all physics calculators"""
+
+    __slots__ = ("history", "inputs", "results")
     
     def __init__(self, history: CalculationHistory):
         self.history = history
         self.inputs: Dict = {}
         self.results: Dict = {}
     
+    def collect_inputs(self, prompts: Dict[str, str]) -> Dict:
+        """Ask for each input, or read them all from one line when stdin is not a terminal"""
+        if sys.stdin.isatty():
+            return {key: get_float_input(prompt) for key, prompt in prompts.items()}
+        values = get_floats_batch(f"Values ({' '.join(prompts)}, _ to skip): ", len(prompts))
+        return dict(zip(prompts, values))
+
     @abstractmethod
     def get_inputs(self):
         """Get inputs from user"""
@@ -144,63 +375,211 @@ class PhysicCalcution(ABC):
             self.get_inputs()
             self.calculate()
             self.display_results()
-            self.history.add_calculation(
-                topic=self.__class__.__name__,
-                inputs=self.inputs,
-                results=self.results
-            )
+            if self.results and self.history.remember(self.fingerprint()):
+                self.history.add_calculation(
+                    topic=self.__class__.__name__,
+                    inputs=self.inputs,
+                    results=self.results
+                )
         except Exception as e:
             print(f"Calculation Error: {e}")
 
+    def fingerprint(self) -> int:
+        """Hash of the calculator type, inputs and numeric results"""
+        return hash((
+            self.__class__.__name__,
+            tuple(sorted(self.inputs.items())),
+            tuple(sorted((k, v) for k, v in self.results.items() if k != "formula"))
+        ))
+
+
+
+def _motion_speed(speed, time, distance):
+    if time == 0:
+        raise ValueError("Time cannot be zero!")
+    return distance / time
+
+
+def _motion_time(speed, time, distance):
+    if speed == 0:
+        raise ValueError("Speed cannot be zero!")
+    return distance / speed
+
+
+# keyed by the missing-input mask: speed = 0b001, time = 0b010, distance = 0b100
+_MOTION_DISPATCH: Dict[int, Tuple[Callable, str]] = {
+    0b001: (_motion_speed, "speed"),
+    0b010: (_motion_time, "time"),
+    0b100: (lambda speed, time, distance: speed * time, "distance"),
+}
+
+
+@functools.lru_cache(maxsize=512)
+def _solve_motion(speed, time, distance) -> Dict:
+    """Solve v = s / t for the one missing value"""
+    mask = (speed is None) | ((time is None) << 1) | ((distance is None) << 2)
+
+    # Check if exactly 2 values provided
+    if mask not in _MOTION_DISPATCH:
+        raise ValueError("You must provide exactly 2 values!")
+    handler, key = _MOTION_DISPATCH[mask]
+
+    try:
+        return {key: handler(speed, time, distance)}
+    except ZeroDivisionError:
+        raise ValueError("Cannot divide by zero!")
 
 
 class Motion(PhysicCalcution):
     """ Calculate basic motion variables (v = s / t)"""
+
+    __slots__ = ()
     
     def get_inputs(self):
         print("====== BASIC MOTION ======")
         print("Enter known values (if you don't know press Enter to skip)")
         print("Formula is v = s / t")
         
-        self.inputs = {
-            "speed": get_float_input("Speed (m/s): "),
-            "time": get_float_input("Time (s): "),
-            "distance": get_float_input("Distance (m): ")  
-        }
+        self.inputs = self.collect_inputs({
+            "speed": "Speed (m/s): ",
+            "time": "Time (s): ",
+            "distance": "Distance (m): "
+        })
 
     def calculate(self):
-        speed = self.inputs["speed"]
-        time = self.inputs["time"]
-        distance = self.inputs["distance"]
-
-        # Check if exactly 2 values provided
-        none_count = sum(val is None for val in [speed, time, distance])
-        if none_count != 1:
-            raise ValueError("You must provide exactly 2 values!")
-
-        try:
-            if speed is None:
-                if time == 0:
-                    raise ValueError("Time cannot be zero!")
-                self.results["speed"] = distance / time
-            elif distance is None:
-                self.results["distance"] = speed * time
-            elif time is None:
-                if speed == 0:
-                    raise ValueError("Speed cannot be zero!")
-                self.results["time"] = distance / speed
-        except ZeroDivisionError:
-            raise ValueError("Cannot divide by zero!")
+        self.results = dict(_solve_motion(**self.inputs))
 
     def display_results(self):
         print("====== Calculating ======")
 
         for key, value in self.results.items():
-            print(f"{key.capitalize()}: {value:.2f}")
+            print(f"{_LABELS[key]}: {value:.2f}")
+
+
+
+# Equation of motion solvers, all called as handler(u, v, a, t, s)
+
+def _eom_acceleration_from_time(u, v, a, t, s):
+    if t == 0:
+        raise ValueError("Time cannot be zero!")
+    return (v - u) / t
+
+
+def _eom_time_from_velocity(u, v, a, t, s):
+    if a == 0:
+        raise ValueError("Acceleration cannot be zero!")
+    return (v - u) / a
+
+
+def _eom_initial_velocity_from_distance(u, v, a, t, s):
+    if t == 0:
+        raise ValueError("Time cannot be zero!")
+    return (s - 0.5 * a * (t * t)) / t
+
 
+def _eom_acceleration_from_distance(u, v, a, t, s):
+    if t == 0:
+        raise ValueError("Time cannot be zero!")
+    return 2 * (s - u * t) / (t * t)
+
+
+def _eom_final_velocity_squared(u, v, a, t, s):
+    import math
+
+    velocity_squared = (u * u) + (2 * a * s)
+    if velocity_squared < 0:
+        raise ValueError("Cannot calculate square root of negative number!")
+    return math.sqrt(velocity_squared)
+
+
+def _eom_initial_velocity_squared(u, v, a, t, s):
+    import math
+
+    initial_velocity_squared = (v * v) - (2 * a * s)
+    if initial_velocity_squared < 0:
+        raise ValueError("Cannot calculate square root of negative number!")
+    return math.sqrt(initial_velocity_squared)
+
+
+def _eom_acceleration_from_velocities(u, v, a, t, s):
+    if s == 0:
+        raise ValueError("Distance cannot be zero!")
+    return ((v * v) - (u * u)) / (2 * s)
+
+
+def _eom_distance_from_velocities(u, v, a, t, s):
+    if a == 0:
+        raise ValueError("Acceleration cannot be zero!")
+    return ((v * v) - (u * u)) / (2 * a)
+
+
+# bit i of a mask is set when input _EOM_KEYS[i] is provided
+_EOM_KEYS = ("initial_velocity", "final_velocity", "acceleration", "time", "distance")
+
+# (unknown, required inputs, handler, formula), checked in priority order
+_EOM_RULES = (
+    # v = u + at
+    ("final_velocity", ("initial_velocity", "acceleration", "time"),
+     lambda u, v, a, t, s: u + (a * t), "v = u + at"),
+    ("initial_velocity", ("final_velocity", "acceleration", "time"),
+     lambda u, v, a, t, s: v - (a * t), "v = u + at"),
+    ("acceleration", ("final_velocity", "initial_velocity", "time"),
+     _eom_acceleration_from_time, "v = u + at"),
+    ("time", ("final_velocity", "initial_velocity", "acceleration"),
+     _eom_time_from_velocity, "v = u + at"),
+    # s = ut + 0.5at²
+    ("distance", ("initial_velocity", "time", "acceleration"),
+     lambda u, v, a, t, s: (u * t) + (0.5 * (a * (t * t))), "s = ut + 0.5at²"),
+    ("initial_velocity", ("distance", "time", "acceleration"),
+     _eom_initial_velocity_from_distance, "s = ut + 0.5at²"),
+    ("acceleration", ("distance", "initial_velocity", "time"),
+     _eom_acceleration_from_distance, "s = ut + 0.5at²"),
+    # v² = u² + 2as
+    ("final_velocity", ("initial_velocity", "acceleration", "distance"),
+     _eom_final_velocity_squared, "v² = u² + 2as"),
+    ("initial_velocity", ("final_velocity", "acceleration", "distance"),
+     _eom_initial_velocity_squared, "v² = u² + 2as"),
+    ("acceleration", ("final_velocity", "initial_velocity", "distance"),
+     _eom_acceleration_from_velocities, "v² = u² + 2as"),
+    ("distance", ("final_velocity", "initial_velocity", "acceleration"),
+     _eom_distance_from_velocities, "v² = u² + 2as"),
+)
+
+
+def _build_eom_dispatch() -> Dict[int, Tuple[Callable, str, str]]:
+    """Map every input mask to the first rule that can solve it"""
+    dispatch = {}
+    for mask in range(1 << len(_EOM_KEYS)):
+        provided = {key for i, key in enumerate(_EOM_KEYS) if mask >> i & 1}
+        for unknown, required, handler, formula in _EOM_RULES:
+            if unknown not in provided and provided.issuperset(required):
+                dispatch[mask] = (handler, unknown, formula)
+                break
+    return dispatch
+
+
+_EOM_DISPATCH: Dict[int, Tuple[Callable, str, str]] = _build_eom_dispatch()
+
+
+@functools.lru_cache(maxsize=512)
+def _solve_equation_of_motion(initial_velocity, final_velocity, acceleration, time, distance) -> Dict:
+    """Solve the equations of motion for the one missing value"""
+    values = (initial_velocity, final_velocity, acceleration, time, distance)
+    mask = sum((value is not None) << i for i, value in enumerate(values))
+
+    if mask not in _EOM_DISPATCH:
+        raise ValueError("Insufficient data or invalid combination of inputs!")
+    handler, key, formula = _EOM_DISPATCH[mask]
+
+    try:
+        return {key: handler(*values), "formula": formula}
+    except ZeroDivisionError:
+        raise ValueError("Division by zero error!")
 
 
 class EquationOfMotion(PhysicCalcution):
+    __slots__ = ()
+
     def get_inputs(self):
         """ Calculate equations of motion variable"""
         print("====== EQUATIONS OF MOTION ======")
@@ -211,100 +590,16 @@ class EquationOfMotion(PhysicCalcution):
         print("v² = u² + 2as")
 
     
-        self.inputs = {
-                "initial_velocity": get_float_input("Initial velocity u (m/s): "),
-                "final_velocity": get_float_input("Final velocity v (m/s): "),
-                "acceleration": get_float_input("Acceleration a (m/s²): "),
-                "time": get_float_input("Time t (s): "),
-                "distance": get_float_input("Distance s (m): ")
-            }
+        self.inputs = self.collect_inputs({
+                "initial_velocity": "Initial velocity u (m/s): ",
+                "final_velocity": "Final velocity v (m/s): ",
+                "acceleration": "Acceleration a (m/s²): ",
+                "time": "Time t (s): ",
+                "distance": "Distance s (m): "
+            })
 
     def calculate(self):
-        initial_velocity = self.inputs["initial_velocity"]
-        final_velocity = self.inputs["final_velocity"]
-        acceleration = self.inputs["acceleration"]
-        time = self.inputs["time"]
-        distance = self.inputs["distance"]
-
-        try:
-            # v = u + at
-            # find v
-            if final_velocity is None and initial_velocity is not None and acceleration is not None and time is not None:
-                self.results["final_velocity"] = initial_velocity + (acceleration * time)
-                self.results["formula"] = "v = u + at"
-            # find u
-            elif final_velocity is not None and initial_velocity is None and acceleration is not None and time is not None:
-                self.results["initial_velocity"] = final_velocity - (acceleration * time)
-                self.results["formula"] = "v = u + at"
-            # find a
-            elif final_velocity is not None and initial_velocity is not None and acceleration is None and time is not None:
-                if time == 0:
-                    raise ValueError("Time cannot be zero!")
-                self.results["acceleration"] = (final_velocity - initial_velocity) / time
-                self.results["formula"] = "v = u + at"
-            # find t
-            elif final_velocity is not None and initial_velocity is not None and acceleration is not None and time is None:
-                if acceleration == 0:
-                    raise ValueError("Acceleration cannot be zero!")
-                self.results["time"] = (final_velocity - initial_velocity) / acceleration
-                self.results["formula"] = "v = u + at"
-
-            # s = ut + 0.5at²
-            # find s
-            elif distance is None and initial_velocity is not None and time is not None and acceleration is not None:  # เปลี่ยนเป็น elif
-                self.results["distance"] = (initial_velocity * time) + \
-                    (0.5 * (acceleration * (time ** 2)))
-                self.results["formula"] = "s = ut + 0.5at²"
-            # find u
-            elif distance is not None and initial_velocity is None and time is not None and acceleration is not None:
-                if time == 0:
-                    raise ValueError("Time cannot be zero!")
-                self.results["initial_velocity"] = (distance - 0.5 * acceleration * (time ** 2)) / time  # ลบ "initial_velocity =" ซ้ำออก
-                self.results["formula"] = "s = ut + 0.5at²"
-            # find a
-            elif distance is not None and initial_velocity is not None and time is not None and acceleration is None:
-                if time == 0:
-                    raise ValueError("Time cannot be zero!")
-                self.results["acceleration"] =  2 * (distance - initial_velocity * time) / (time ** 2)
-                self.results["formula"] = "s = ut + 0.5at²"
-        
-
-            # v² = u² + 2as
-            # find v
-            elif final_velocity is None and initial_velocity is not None and acceleration is not None and distance is not None:  # เปลี่ยนเป็น elif
-                velocity_squared = (initial_velocity ** 2) + \
-                    (2 * acceleration * distance)  # แก้ชื่อตัวแปรเป็น velocity_squared
-                if velocity_squared < 0:
-                    raise ValueError("Cannot calculate square root of negative number!")
-                self.results["final_velocity"] = math.sqrt(velocity_squared)  # ใช้ชื่อตัวแปรที่ถูกต้อง
-                self.results["formula"] = "v² = u² + 2as"
-            # find u
-            elif final_velocity is not None and initial_velocity is None and acceleration is not None and distance is not None:
-                initial_velocity_squared = (
-                    final_velocity ** 2) - (2 * acceleration * distance)  # เปลี่ยนชื่อให้สอดคล้อง
-                if initial_velocity_squared < 0:
-                    raise ValueError("Cannot calculate square root of negative number!")
-                self.results["initial_velocity"] = math.sqrt(initial_velocity_squared)
-                self.results["formula"] = "v² = u² + 2as"
-            # find a
-            elif final_velocity is not None and initial_velocity is not None and acceleration is None and distance is not None:
-                if distance == 0:
-                    raise ValueError("Distance cannot be zero!")
-                self.results["acceleration"] = ((final_velocity ** 2) - (initial_velocity ** 2)) / (2 * distance)
-                self.results["formula"] = "v² = u² + 2as"
-            # find s
-            elif final_velocity is not None and initial_velocity is not None and acceleration is not None and distance is None:
-                if acceleration == 0:
-                    raise ValueError("Acceleration cannot be zero!")
-                self.results["distance"] = ((final_velocity ** 2) -
-                            (initial_velocity ** 2)) / (2 * acceleration)
-                self.results["formula"] = "v² = u² + 2as"
-            
-            else:
-                raise ValueError("Insufficient data or invalid combination of inputs!")
-            
-        except ZeroDivisionError:
-            raise ValueError("Division by zero error!")
+        self.results = dict(_solve_equation_of_motion(**self.inputs))
     
     def display_results(self):
         print("CALCULATION RESULTS")
@@ -312,76 +607,85 @@ class EquationOfMotion(PhysicCalcution):
         
         for key, value in self.results.items():
             if key != "formula":
-                print(f"{key.replace('_', ' ').title()}: {value:.2f}")
+                print(f"{_LABELS[key]}: {value:.2f}")
     
 
 
 
-class FreeFall(PhysicCalcution):
-    """ Calculate Free fall variables"""
-    def get_inputs(self):
-        
-        print("====== FREE FALL ======")
-        print("Enter known values (if you don't know press Enter to skip)")
-
-        self.inputs = {
-            "final_velocity": get_float_input("Final velocity (m/s): "),
-            "height": get_float_input("Height (m): "),
-            "time": get_float_input("Time (s): ")
-        }
+@functools.lru_cache(maxsize=512)
+def _solve_free_fall(final_velocity, height, time) -> Dict:
+    """Solve the free fall formulas for the one missing value"""
+    import math
 
+    results = {}
+    gravity = Constant.GRAVITY_FORCE 
 
-    def calculate(self):  
+    # Check if exactly 2 values provided
+    none_count = sum(val is None for val in [final_velocity, height, time])
+    if none_count != 1:
+        raise ValueError("You must provide exactly 2 values!")
 
-        final_velocity = self.inputs["final_velocity"]
-        height = self.inputs["height"] 
-        time = self.inputs["time"]
-        gravity = Constant.GRAVITY_FORCE 
+    # v = gt
+    # find v
+    try:
+        if final_velocity is None and time is not None:
+            results["final_velocity"] = gravity * time
+            results["formula"] = "v = gt"
 
-        # Check if exactly 2 values provided
-        none_count = sum(val is None for val in [final_velocity, height, time])
-        if none_count != 1:
-            raise ValueError("You must provide exactly 2 values!")
+    # find t
+        elif time is None and final_velocity is not None:
+            results["time"] = final_velocity / gravity
+            results["formula"] = "v = gt"
 
-        # v = gt
+        # v² = 2gh
         # find v
-        try:
-            if final_velocity is None and time is not None:
-                self.results["final_velocity"] = gravity * time
-                self.results["formula"] = "v = gt"
+        elif final_velocity is None and height is not None:  
+            results["final_velocity"] = math.sqrt(2 * gravity * height)
+            results["formula"] = "v² = 2gh"
+
+        # find h
+        elif height is None and final_velocity is not None:
+            results["height"] = (final_velocity * final_velocity) / (2 * gravity)
+            results["formula"] = "v² = 2gh"
+
+        # h = 0.5gt²
+        # find h
+        elif height is None and time is not None: 
+            results["height"] = 0.5 * gravity * (time * time)  
+            results["formula"] = "h = 0.5gt²"
 
         # find t
-            elif time is None and final_velocity is not None:
-                self.results["time"] = final_velocity / gravity
-                self.results["formula"] = "v = gt"
-
-            # v² = 2gh
-            # find v
-            elif final_velocity is None and height is not None:  
-                self.results["final_velocity"] = math.sqrt(2 * gravity * height)
-                self.results["formula"] = "v² = 2gh"
-
-            # find h
-            elif height is None and final_velocity is not None:
-                self.results["height"] = (final_velocity ** 2) / (2 * gravity)
-                self.results["formula"] = "v² = 2gh"
-
-            # h = 0.5gt²
-            # find h
-            elif height is None and time is not None: 
-                self.results["height"] = 0.5 * gravity * (time ** 2)  
-                self.results["formula"] = "h = 0.5gt²"
-
-            # find t
-            elif time is None and height is not None:
-                self.results["time"] = math.sqrt(2 * height / gravity)
-                self.results["formula"] = "h = 0.5gt²"
-            
-            else:
-                raise ValueError("Insufficient data or invalid combination of inputs!")        
+        elif time is None and height is not None:
+            results["time"] = math.sqrt(2 * height / gravity)
+            results["formula"] = "h = 0.5gt²"
         
-        except ZeroDivisionError:
-            raise ValueError("Division by zero error!")
+        else:
+            raise ValueError("Insufficient data or invalid combination of inputs!")        
+    
+    except ZeroDivisionError:
+        raise ValueError("Division by zero error!")
+    return results
+
+
+class FreeFall(PhysicCalcution):
+    """ Calculate Free fall variables"""
+
+    __slots__ = ()
+
+    def get_inputs(self):
+        
+        print("====== FREE FALL ======")
+        print("Enter known values (if you don't know press Enter to skip)")
+
+        self.inputs = self.collect_inputs({
+            "final_velocity": "Final velocity (m/s): ",
+            "height": "Height (m): ",
+            "time": "Time (s): "
+        })
+
+
+    def calculate(self):
+        self.results = dict(_solve_free_fall(**self.inputs))
 
     def display_results(self):
         print("CALCULATION RESULTS")
@@ -389,7 +693,7 @@ class FreeFall(PhysicCalcution):
         
         for key, value in self.results.items():
             if key != "formula":
-                print(f"{key.replace('_', ' ').title()}: {value:.2f}")
+                print(f"{_LABELS[key]}: {value:.2f}")
 
 
 
@@ -414,40 +718,45 @@ class PhysicsAssistant:
                                                                              
 """
 
+    _MOTION_CALCS = (Motion, EquationOfMotion, FreeFall)
+
     def __init__(self):
         self.history = None
     
     def clear_screen(self):
-        os.system("cls" if os.name == "nt" else "clear")
+        # legacy Windows consoles outside Windows Terminal ignore ANSI escapes
+        if os.name == "nt" and not os.environ.get("WT_SESSION"):
+            os.system("cls")
+            return
+        sys.stdout.write("\033[2J\033[H")
+        sys.stdout.flush()
 
     def show_banner(self):
         self.clear_screen()
-        print(self.banner)
+        sys.stdout.write(self.banner + "\n")
 
     def show_main_menu(self) -> int: 
-        print("====== Main Menu ======")
-        print("1. Motion Calculations")
-        print("2. Show Calculations History")
-        print("3. Clear History")
-        print("0. Exit")
+        sys.stdout.write(
+            "====== Main Menu ======\n"
+            "1. Motion Calculations\n"
+            "2. Show Calculations History\n"
+            "3. Clear History\n"
+            "0. Exit\n"
+        )
         
         return get_int_input("Enter your choice: ", 0, 3)  
 
     def show_motion_menu(self):
-        print("====== Motion Menu ======")
-        print("1. Basic Motion")
-        print("2. Equation of Motion")
-        print("3. Free Fall")
+        sys.stdout.write(
+            "====== Motion Menu ======\n"
+            "1. Basic Motion\n"
+            "2. Equation of Motion\n"
+            "3. Free Fall\n"
+        )
 
         choice = get_int_input("Enter your choice: ", 1, 3) 
-        
-        calculators = {
-            1: Motion,
-            2: EquationOfMotion,
-            3: FreeFall
-        }
 
-        calculator = calculators[choice](self.history)
+        calculator = self._MOTION_CALCS[choice - 1](self.history)
         calculator.run()
 
     def run(self):
@@ -1,9 +1,5 @@
 def custom_generator(data):
-    
-    for index in range(len(data)):
-        element = data[index]
-
-        yield index, element
+    yield from enumerate(data)
 
 enum = custom_generator(['a', 'b', 'c'])
 